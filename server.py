@@ -99,8 +99,8 @@ def process_chart_response(response: str) -> Any:
     if response.startswith("CHART_ARTIFACT:"):
         try:
             # Extract the artifact data
-            artifact_json = response.replace("CHART_ARTIFACT:", "")
-            artifact_data = eval(artifact_json)  # Safe because we control the input
+            artifact_json = response[len("CHART_ARTIFACT:"):]
+            artifact_data = json.loads(artifact_json)
             
             logger.info(f"📊 Processing chart artifact: {artifact_data.get('title', 'Unknown Chart')}")
             
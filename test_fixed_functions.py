@@ -3,6 +3,7 @@
 Test the fixed pybaseball MCP functions
 """
 
+import asyncio
 import sys
 import os
 sys.path.append('/Users/wseke/Documents/pybaseball-mcp-server')
@@ -50,7 +51,7 @@ def test_batting_stats():
     try:
         # Test with mock context
         ctx = MockContext()
-        result = batting_tool(season=2024, qual=50, ctx=ctx)
+        result = asyncio.run(batting_tool(season=2024, qual=50, ctx=ctx))
         
         if "❌" in result:
             print(f"❌ Batting stats test failed: {result}")
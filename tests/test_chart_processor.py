@@ -0,0 +1,54 @@
+"""
+Tests for chart output parsing in utils.chart_display.chart_processor.
+"""
+
+import time
+
+import pytest
+
+from utils.chart_display.chart_processor import ChartProcessor
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def processor():
+    return ChartProcessor()
+
+
+def test_extract_chart_data_classifies_lines(processor):
+    output = (
+        "# Aaron Judge - 2024 Spray Chart\n"
+        "- stray bullet before any section\n"
+        "  📊 **Hit Summary**  \n"
+        "- Total Hits: 150\n"
+        "| Type | Count |\n"
+        "# not | a table\n"
+    )
+    data = processor.extract_chart_data(output, 'spray_chart')
+    
+    assert data['title'] == "Aaron Judge - 2024 Spray Chart"
+    assert data['insights'] == ["📊 **Hit Summary**", "- Total Hits: 150"]
+    assert data['tabular_data'] == ["| Type | Count |"]
+
+
+def test_extract_chart_data_padded_lines_stay_linear(processor):
+    # Long interior whitespace runs used to backtrack quadratically
+    run = ' ' * 200000
+    output = "\n".join([f"a|{run}x", f"📊 Header{run}end", f"- bullet{run}end"])
+    
+    start = time.perf_counter()
+    data = processor.extract_chart_data(output, 'spray_chart')
+    elapsed = time.perf_counter() - start
+    
+    assert data['tabular_data'] == [f"a|{run}x"]
+    assert data['insights'] == [f"📊 Header{run}end", f"- bullet{run}end"]
+    assert elapsed < 1.0
+
+
+def test_detect_chart_type_prefers_spray_chart(processor):
+    output = "# 2024 Batting Comparison\n# Judge - 2024 Spray Chart"
+    assert processor.detect_chart_type(output) == 'spray_chart'
+    assert processor.detect_chart_type("# 2024 Pitching Comparison") == 'comparison_chart'
+    assert processor.detect_chart_type("no chart here") is None
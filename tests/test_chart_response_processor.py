@@ -0,0 +1,31 @@
+"""
+Tests for chart response handling in utils.chart_processor.
+"""
+
+import pytest
+
+from utils.chart_processor import extract_chart_summary
+
+
+pytestmark = pytest.mark.unit
+
+
+def test_extract_chart_summary_keeps_insight_inside_heading():
+    summary = extract_chart_summary("## 📊 **Power Metrics**\n- HR: 40")
+    
+    assert summary["title"] == "📊 **Power Metrics**"
+    assert summary["key_metrics"] == ["HR: 40"]
+    assert summary["insights"] == ["Power Metrics"]
+
+
+def test_extract_chart_summary_title_is_first_heading_anywhere():
+    summary = extract_chart_summary("- Note: see # Appendix\n# Real Title")
+    
+    assert summary["title"] == "Appendix"
+    assert summary["key_metrics"] == ["Note: see # Appendix"]
+
+
+def test_extract_chart_summary_limits_key_metrics():
+    response = "\n".join(f"- Stat{i}: {i}" for i in range(8))
+    
+    assert extract_chart_summary(response)["key_metrics"] == [f"Stat{i}: {i}" for i in range(5)]
@@ -0,0 +1,39 @@
+"""
+Tests for utils.data_processing markdown formatting.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.data_processing import DataProcessor
+
+
+pytestmark = pytest.mark.unit
+
+
+def test_format_dataframe_as_markdown_cells():
+    # Object dtype keeps None (blank cell) and NaN ("nan") apart on every pandas version
+    df = pd.DataFrame({
+        'Name': pd.Series(['Judge', None], dtype=object),
+        'Team': pd.Series([np.nan, 'NYY'], dtype=object),
+        'HR': [58, 12],
+        'AVG': [0.31234, 200.0],
+        'OPS': [1234567.25, np.nan],
+    })
+    
+    lines = DataProcessor().format_dataframe_as_markdown(df, "Leaders").splitlines()
+    
+    assert lines[:4] == [
+        "## Leaders",
+        "",
+        "| Name | Team | HR | AVG | OPS |",
+        "|:---|:---|---:|---:|---:|",
+    ]
+    # Floats use general format: whole numbers drop the ".0", large values use exponents
+    assert lines[4] == "| Judge | nan | 58 | 0.312 | 1.23457e+06 |"
+    assert lines[5] == "|  | NYY | 12 | 200 | nan |"
+
+
+def test_format_dataframe_as_markdown_empty():
+    assert DataProcessor().format_dataframe_as_markdown(pd.DataFrame(), "None") == "## None\n\nNo data available."
@@ -0,0 +1,64 @@
+"""
+Tests for utils.validation batch validators against their scalar counterparts.
+"""
+
+import pytest
+
+from utils.validation import Validator, ValidationError
+
+
+pytestmark = pytest.mark.unit
+
+
+def _scalar_results(validate, items):
+    """Run a scalar validator per item, shaped like a batch validator result"""
+    values, errors = [], {}
+    for pos, item in enumerate(items):
+        try:
+            values.append(validate(item))
+        except ValidationError as e:
+            values.append(None)
+            errors[pos] = str(e)
+    return values, errors
+
+
+@pytest.fixture
+def validator():
+    return Validator()
+
+
+PLAYER_NAMES = [
+    "Mike Trout", "  Shohei Ohtani  ", "O'Neil Cruz", "J.D. Martinez", "Jean-Carlos",
+    "", "   ", "A", " A ", "x" * 51, "Bad1 Name", "Tab\tName",
+    None, 5, 3.5, ["Mike Trout"],
+]
+
+DATES = [
+    "2023-01-05", "2023-13-01", "2023-02-30", "1000-01-01", "9999-12-31",
+    "1/5/2023", "01-05-2023", "2023/01/05", "2023-1-5", "bad", "",
+    None, 20230105,
+]
+
+TEAMS = ["NYY", "nyy", " bos ", "Sf\t", "XX", "", "   ", None, 7]
+
+
+@pytest.mark.parametrize("items", [[], PLAYER_NAMES, [None, 5]])
+def test_validate_player_names_matches_scalar(validator, items):
+    assert validator.validate_player_names(items) == _scalar_results(validator.validate_player_name, items)
+
+
+@pytest.mark.parametrize("items", [[], DATES, [None, 3]])
+def test_validate_dates_matches_scalar(validator, items):
+    assert validator.validate_dates(items) == _scalar_results(validator.validate_date, items)
+
+
+@pytest.mark.parametrize("items", [[], TEAMS, [None, 7]])
+def test_validate_teams_matches_scalar(validator, items):
+    assert validator.validate_teams(items) == _scalar_results(validator.validate_team, items)
+
+
+def test_batch_validators_accept_generators(validator):
+    values, errors = validator.validate_teams(team for team in ["nyy", "xx"])
+    
+    assert values == ["NYY", None]
+    assert list(errors) == [1]
@@ -12,13 +12,14 @@ import seaborn as sns
 import numpy as np
 import pandas as pd
 import io
+import json
 from typing import Optional, List, Dict, Any, Tuple
 
 from mcp.server.fastmcp import FastMCP, Context
 import pybaseball as pyb
 from utils.data_processing import DataProcessor
 from utils.validation import Validator, ValidationError
-from utils.chart_display import ChartProcessor, create_chart_artifact
+from utils.chart_display import create_chart_artifact
 
 logger = logging.getLogger(__name__)
 
@@ -137,7 +138,6 @@ def register_plotting_tools(mcp: FastMCP):
             insights = _calculate_spray_insights_structured(hits_df, clean_name, season)
             
             # Process chart data for artifact creation
-            chart_processor = ChartProcessor()
             chart_data = {
                 'type': 'spray_chart',
                 'title': f"{clean_name} - {season} Spray Chart",
@@ -149,7 +149,7 @@ def register_plotting_tools(mcp: FastMCP):
             # Create artifact
             artifact_data = create_chart_artifact(chart_data, compact=True)
             
-            return f"CHART_ARTIFACT:{artifact_data}"
+            return f"CHART_ARTIFACT:{json.dumps(artifact_data)}"
             
         except ValidationError as e:
             return f"❌ Validation Error: {e}"
@@ -289,7 +289,7 @@ def register_plotting_tools(mcp: FastMCP):
             # Create artifact
             artifact_data = create_chart_artifact(chart_data, compact=True)
             
-            return f"CHART_ARTIFACT:{artifact_data}"
+            return f"CHART_ARTIFACT:{json.dumps(artifact_data)}"
             
         except ValidationError as e:
             return f"❌ Validation Error: {e}"
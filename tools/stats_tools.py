@@ -5,7 +5,9 @@ These tools provide access to batting, pitching, and fielding statistics
 from various sources including FanGraphs and Baseball Reference.
 """
 
+import asyncio
 import logging
+from functools import lru_cache
 from typing import Optional, Union, List
 
 from mcp.server.fastmcp import FastMCP, Context
@@ -16,6 +18,17 @@ from utils.validation import Validator, ValidationError
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _lookup_player(name: str):
+    """
+    Fuzzy-lookup a player in the Chadwick register, memoized per process.
+    
+    The register does not change while the server is running, so repeat
+    lookups for the same name can skip the download and fuzzy match.
+    """
+    return pyb.playerid_lookup(name, fuzzy=True)
+
+
 def _map_stat_columns_to_enum(stat_type_str: str, category: str) -> Optional[List]:
     """
     Future implementation: Map string stat types to proper pybaseball enums.
@@ -42,31 +55,44 @@ def _map_stat_columns_to_enum(stat_type_str: str, category: str) -> Optional[Lis
     return None
 
 
-def register_stats_tools(mcp: FastMCP):
-    """Register all statistics-related tools with the MCP server"""
+def _make_season_stats_tool(
+    pyb_fn,
+    kind: str,
+    default_qual: int,
+    qual_max: int,
+    unit: str,
+    unit_label: str,
+    empty_suffix: str,
+    about: str
+):
+    """
+    Build a season-level FanGraphs stats tool for batting or pitching.
     
-    @mcp.tool()
-    def get_batting_stats(
+    Both tools share the same validation, fetch and formatting path and only
+    differ in the pybaseball function they call and the qualifier wording.
+    
+    Args:
+        pyb_fn: pybaseball function to fetch the season table
+        kind: "batting" or "pitching"
+        default_qual: Default qualifier value
+        qual_max: Largest accepted qualifier value
+        unit: Short qualifier unit used in titles (e.g., "PA")
+        unit_label: Long qualifier unit used in insights (e.g., "plate appearances")
+        empty_suffix: Text appended to the qualifier in the no-data message
+        about: Description of the default stat columns
+        
+    Returns:
+        Async tool function ready to be registered with FastMCP
+    """
+    
+    async def tool(
         season: int,
         split_seasons: bool = True,
         stat_columns: str = "standard",
         league: str = "all",
-        qual: int = 50,
+        qual: int = default_qual,
         ctx: Context = None
     ) -> str:
-        """
-        Get batting statistics for a season from FanGraphs.
-        
-        Args:
-            season: Season year (e.g., 2023)
-            split_seasons: Whether to split seasons (for trades)
-            stat_columns: Type of stats ("standard", "advanced", "batted_ball", "more", "pitch_type", "plate_discipline")
-            league: League filter ("all", "al", "nl")
-            qual: Minimum plate appearances qualifier
-            
-        Returns:
-            Formatted batting statistics table with insights
-        """
         try:
             # Get app context
             validator = ctx.request_context.lifespan_context.validator
@@ -74,31 +100,29 @@ def register_stats_tools(mcp: FastMCP):
             
             # Validate inputs
             season = validator.validate_season(season)
-            qual = validator.validate_numeric_range(qual, min_val=0, max_val=700, param_name="qual")
-            
-            logger.info(f"Getting batting stats for season {season}, qual {qual}, stat_columns {stat_columns}")
+            qual = validator.validate_numeric_range(qual, min_val=0, max_val=qual_max, param_name="qual")
             
-            # Handle stat_columns parameter - use default if "standard", otherwise investigate enums
-            actual_stat_columns = None  # Use pybaseball default
+            logger.info(f"Getting {kind} stats for season {season}, qual {qual}, stat_columns {stat_columns}")
             
             if stat_columns != "standard":
                 # For now, log the request but use default columns
                 # TODO: Implement proper enum mapping for advanced stat types
                 logger.warning(f"Advanced stat_columns '{stat_columns}' requested but using default columns for now")
                 # In future versions, we can implement:
-                # stat_columns = _map_stat_columns_to_enum(stat_columns, "batting")
+                # stat_columns = _map_stat_columns_to_enum(stat_columns, kind)
             
             valid_leagues = ["all", "al", "nl"]
             league = league.lower()
             if league not in valid_leagues:
                 raise ValidationError(f"Invalid league. Valid options: {', '.join(valid_leagues)}")
             
-            # Get batting stats with comprehensive error handling
+            # Get stats with comprehensive error handling
             try:
-                logger.info(f"Calling pybaseball.batting_stats with params: season={season}, split_seasons={split_seasons}, league={league}, qual={qual}")
+                logger.info(f"Calling pybaseball.{kind}_stats with params: season={season}, split_seasons={split_seasons}, league={league}, qual={qual}")
                 
                 # Call pybaseball without stat_columns for now (uses defaults)
-                df = pyb.batting_stats(
+                df = await asyncio.to_thread(
+                    pyb_fn,
                     start_season=season,
                     end_season=season,
                     split_seasons=split_seasons,
@@ -106,133 +130,82 @@ def register_stats_tools(mcp: FastMCP):
                     qual=qual
                     # Note: stat_columns parameter omitted to use defaults
                 )
-                logger.info(f"Successfully retrieved {len(df) if not df.empty else 0} batting records")
+                logger.info(f"Successfully retrieved {len(df) if not df.empty else 0} {kind} records")
             except Exception as pyb_error:
                 logger.error(f"Pybaseball error: {type(pyb_error).__name__}: {pyb_error}")
-                return f"❌ Error fetching batting statistics from pybaseball: {pyb_error}"
+                return f"❌ Error fetching {kind} statistics from pybaseball: {pyb_error}"
             
             if df.empty:
-                return f"❌ No batting statistics found for {season} with qualifier {qual}+"
+                return f"❌ No {kind} statistics found for {season} with qualifier {qual}+{empty_suffix}"
             
             # Format response
-            title = f"{season} Batting Statistics (Default Stats) - Min {qual} PA"
-            response = data_processor.format_dataframe_as_markdown(df, title)
+            title = f"{season} {kind.title()} Statistics (Default Stats) - Min {qual} {unit}"
+            parts = [data_processor.format_dataframe_as_markdown(df, title)]
             
             # Add insights
             insights = data_processor.create_summary_insights(
-                df, f"{season} season with {qual}+ plate appearances"
+                df, f"{season} season with {qual}+ {unit_label}"
             )
-            response += f"\n\n### Season Insights\n{insights}"
+            parts.append(f"\n\n### Season Insights\n{insights}")
             
             # Add context about the stats
-            response += f"\n\n**About Default Stats**: Standard batting statistics including traditional metrics like AVG, OBP, SLG, HR, RBI, and advanced metrics like WAR."
+            parts.append(f"\n\n**About Default Stats**: {about}")
             
             if stat_columns != "standard":
-                response += f"\n\n*Note: Advanced stat type '{stat_columns}' was requested but default columns are used in this version.*"
+                parts.append(f"\n\n*Note: Advanced stat type '{stat_columns}' was requested but default columns are used in this version.*")
             
-            return response
+            return "".join(parts)
             
         except ValidationError as e:
             return f"❌ Validation Error: {e}"
         except Exception as e:
-            logger.error(f"Error in get_batting_stats: {e}")
-            return f"❌ Error retrieving batting statistics: {e}"
-
-    @mcp.tool()
-    def get_pitching_stats(
-        season: int,
-        split_seasons: bool = True,
-        stat_columns: str = "standard",
-        league: str = "all",
-        qual: int = 20,
-        ctx: Context = None
-    ) -> str:
-        """
-        Get pitching statistics for a season from FanGraphs.
+            logger.error(f"Error in get_{kind}_stats: {e}")
+            return f"❌ Error retrieving {kind} statistics: {e}"
+    
+    tool.__name__ = tool.__qualname__ = f"get_{kind}_stats"
+    tool.__doc__ = f"""
+        Get {kind} statistics for a season from FanGraphs.
         
         Args:
             season: Season year (e.g., 2023)
             split_seasons: Whether to split seasons (for trades)
             stat_columns: Type of stats ("standard", "advanced", "batted_ball", "more", "pitch_type", "plate_discipline")
             league: League filter ("all", "al", "nl")
-            qual: Minimum innings pitched qualifier
+            qual: Minimum {unit_label} qualifier
             
         Returns:
-            Formatted pitching statistics table with insights
+            Formatted {kind} statistics table with insights
         """
-        try:
-            # Get app context
-            validator = ctx.request_context.lifespan_context.validator
-            data_processor = ctx.request_context.lifespan_context.data_processor
-            
-            # Validate inputs
-            season = validator.validate_season(season)
-            qual = validator.validate_numeric_range(qual, min_val=0, max_val=300, param_name="qual")
-            
-            logger.info(f"Getting pitching stats for season {season}, qual {qual}, stat_columns {stat_columns}")
-            
-            # Handle stat_columns parameter - use default if "standard", otherwise investigate enums
-            actual_stat_columns = None  # Use pybaseball default
-            
-            if stat_columns != "standard":
-                # For now, log the request but use default columns
-                # TODO: Implement proper enum mapping for advanced stat types
-                logger.warning(f"Advanced stat_columns '{stat_columns}' requested but using default columns for now")
-                # In future versions, we can implement:
-                # stat_columns = _map_stat_columns_to_enum(stat_columns, "pitching")
-            
-            valid_leagues = ["all", "al", "nl"]
-            league = league.lower()
-            if league not in valid_leagues:
-                raise ValidationError(f"Invalid league. Valid options: {', '.join(valid_leagues)}")
-            
-            # Get pitching stats with comprehensive error handling
-            try:
-                logger.info(f"Calling pybaseball.pitching_stats with params: season={season}, split_seasons={split_seasons}, league={league}, qual={qual}")
-                
-                # Call pybaseball without stat_columns for now (uses defaults)
-                df = pyb.pitching_stats(
-                    start_season=season,
-                    end_season=season,
-                    split_seasons=split_seasons,
-                    league=league,
-                    qual=qual
-                    # Note: stat_columns parameter omitted to use defaults
-                )
-                logger.info(f"Successfully retrieved {len(df) if not df.empty else 0} pitching records")
-            except Exception as pyb_error:
-                logger.error(f"Pybaseball error: {type(pyb_error).__name__}: {pyb_error}")
-                return f"❌ Error fetching pitching statistics from pybaseball: {pyb_error}"
-            
-            if df.empty:
-                return f"❌ No pitching statistics found for {season} with qualifier {qual}+ IP"
-            
-            # Format response
-            title = f"{season} Pitching Statistics (Default Stats) - Min {qual} IP"
-            response = data_processor.format_dataframe_as_markdown(df, title)
-            
-            # Add insights
-            insights = data_processor.create_summary_insights(
-                df, f"{season} season with {qual}+ innings pitched"
-            )
-            response += f"\n\n### Season Insights\n{insights}"
-            
-            # Add context about the stats
-            response += f"\n\n**About Default Stats**: Standard pitching statistics including traditional metrics like ERA, WHIP, K/9, BB/9, and advanced metrics like WAR."
-            
-            if stat_columns != "standard":
-                response += f"\n\n*Note: Advanced stat type '{stat_columns}' was requested but default columns are used in this version.*"
-            
-            return response
-            
-        except ValidationError as e:
-            return f"❌ Validation Error: {e}"
-        except Exception as e:
-            logger.error(f"Error in get_pitching_stats: {e}")
-            return f"❌ Error retrieving pitching statistics: {e}"
+    return tool
+
+
+def register_stats_tools(mcp: FastMCP):
+    """Register all statistics-related tools with the MCP server"""
+    
+    mcp.tool()(_make_season_stats_tool(
+        pyb.batting_stats,
+        kind="batting",
+        default_qual=50,
+        qual_max=700,
+        unit="PA",
+        unit_label="plate appearances",
+        empty_suffix="",
+        about="Standard batting statistics including traditional metrics like AVG, OBP, SLG, HR, RBI, and advanced metrics like WAR."
+    ))
+    
+    mcp.tool()(_make_season_stats_tool(
+        pyb.pitching_stats,
+        kind="pitching",
+        default_qual=20,
+        qual_max=300,
+        unit="IP",
+        unit_label="innings pitched",
+        empty_suffix=" IP",
+        about="Standard pitching statistics including traditional metrics like ERA, WHIP, K/9, BB/9, and advanced metrics like WAR."
+    ))
 
     @mcp.tool()
-    def get_player_batting_stats_range(
+    async def get_player_batting_stats_range(
         start_season: int,
         end_season: int,
         player_name: str,
@@ -263,7 +236,7 @@ def register_stats_tools(mcp: FastMCP):
                 raise ValidationError("Start season must be before or equal to end season")
             
             # Look up player first
-            player_df = pyb.playerid_lookup(clean_name, fuzzy=True)
+            player_df = await asyncio.to_thread(_lookup_player, clean_name)
             if player_df.empty:
                 return f"❌ Player '{clean_name}' not found"
             
@@ -274,7 +247,8 @@ def register_stats_tools(mcp: FastMCP):
                 return f"❌ No FanGraphs ID found for {clean_name}"
             
             # Get batting stats for the range
-            df = pyb.batting_stats_range(
+            df = await asyncio.to_thread(
+                pyb.batting_stats_range,
                 start_dt=f"{start_season}-03-01",
                 end_dt=f"{end_season}-11-01"
             )
@@ -287,7 +261,7 @@ def register_stats_tools(mcp: FastMCP):
             
             # Format response
             title = f"{clean_name} Batting Statistics ({start_season}-{end_season})"
-            response = data_processor.format_dataframe_as_markdown(player_stats, title)
+            parts = [data_processor.format_dataframe_as_markdown(player_stats, title)]
             
             # Add career insights for this period
             if len(player_stats) > 1:
@@ -303,11 +277,11 @@ def register_stats_tools(mcp: FastMCP):
                         }
                 
                 if summary_stats:
-                    response += f"\n\n### Career Summary ({start_season}-{end_season})\n"
+                    parts.append(f"\n\n### Career Summary ({start_season}-{end_season})\n")
                     for stat, values in summary_stats.items():
-                        response += f"- **{stat}**: Avg {values['avg']:.3f}, Best {values['best']:.3f}, Worst {values['worst']:.3f}\n"
+                        parts.append(f"- **{stat}**: Avg {values['avg']:.3f}, Best {values['best']:.3f}, Worst {values['worst']:.3f}\n")
             
-            return response
+            return "".join(parts)
             
         except ValidationError as e:
             return f"❌ Validation Error: {e}"
@@ -316,7 +290,7 @@ def register_stats_tools(mcp: FastMCP):
             return f"❌ Error retrieving player batting statistics: {e}"
 
     @mcp.tool()
-    def get_team_batting_stats(
+    async def get_team_batting_stats(
         season: int,
         team: Optional[str] = None,
         league: str = "all",
@@ -350,7 +324,7 @@ def register_stats_tools(mcp: FastMCP):
                 raise ValidationError(f"Invalid league. Valid options: {', '.join(valid_leagues)}")
             
             # Get team batting stats
-            df = pyb.team_batting(season, league=league)
+            df = await asyncio.to_thread(pyb.team_batting, season, league=league)
             
             if df.empty:
                 return f"❌ No team batting statistics found for {season}"
@@ -366,16 +340,16 @@ def register_stats_tools(mcp: FastMCP):
                 title = f"{season} Team Batting Statistics"
             
             # Format response
-            response = data_processor.format_dataframe_as_markdown(df, title)
+            parts = [data_processor.format_dataframe_as_markdown(df, title)]
             
             # Add league insights
             if team is None:
                 insights = data_processor.create_summary_insights(
                     df, f"{season} team batting performance"
                 )
-                response += f"\n\n### League Insights\n{insights}"
+                parts.append(f"\n\n### League Insights\n{insights}")
             
-            return response
+            return "".join(parts)
             
         except ValidationError as e:
             return f"❌ Validation Error: {e}"
@@ -3,8 +3,11 @@ Artifact creator for baseball charts.
 """
 
 from typing import Dict, Any, Optional
+from string import Template
 import uuid
 
+from .chart_data import CATEGORY_PREFIXES, image_data_uri
+
 
 def create_chart_artifact(chart_data: Dict[str, Any], compact: bool = False) -> Dict[str, Any]:
     """
@@ -38,187 +41,176 @@ def create_chart_artifact(chart_data: Dict[str, Any], compact: bool = False) ->
     return artifact
 
 
-def _create_compact_artifact_content(chart_data: Dict[str, Any]) -> str:
-    """Create compact HTML content for inline display."""
-    
-    # Extract summary metrics
-    summary_data = _extract_summary_metrics(chart_data)
-    
-    html_content = f"""
-<!DOCTYPE html>
+# Compact inline artifact page
+_COMPACT_HTML_TMPL = Template("""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{chart_data.get('title', 'Chart')}</title>
+    <title>$page_title</title>
     <style>
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             margin: 0;
             padding: 15px;
             background-color: #ffffff;
             font-size: 14px;
-        }}
-        .chart-container {{
+        }
+        .chart-container {
             max-width: 500px;
             border: 2px solid #e1e5e9;
             border-radius: 12px;
             overflow: hidden;
             background: white;
             box-shadow: 0 3px 12px rgba(0,0,0,0.15);
-        }}
-        .header {{
+        }
+        .header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 12px 16px;
             font-weight: bold;
             font-size: 16px;
-        }}
-        .content {{
+        }
+        .content {
             padding: 16px;
-        }}
-        .chart-and-data {{
+        }
+        .chart-and-data {
             display: flex;
             gap: 12px;
             align-items: flex-start;
-        }}
-        .chart-image {{
+        }
+        .chart-image {
             flex: 1.2;
             max-width: 250px;
-        }}
-        .chart-image img {{
+        }
+        .chart-image img {
             width: 100%;
             height: auto;
             border-radius: 6px;
             border: 1px solid #ddd;
-        }}
-        .summary-data {{
+        }
+        .summary-data {
             flex: 1;
             font-size: 12px;
             line-height: 1.4;
-        }}
-        .metric {{
+        }
+        .metric {
             margin-bottom: 6px;
             padding: 4px 8px;
             background: #f8f9fa;
             border-radius: 4px;
             border-left: 3px solid #667eea;
-        }}
-        .metric-label {{
+        }
+        .metric-label {
             font-weight: bold;
             color: #495057;
-        }}
-        .metric-value {{
+        }
+        .metric-value {
             color: #6c757d;
-        }}
-        @media (max-width: 400px) {{
-            .chart-and-data {{
+        }
+        @media (max-width: 400px) {
+            .chart-and-data {
                 flex-direction: column;
-            }}
-            .chart-image {{
+            }
+            .chart-image {
                 max-width: 100%;
-            }}
-        }}
+            }
+        }
     </style>
 </head>
 <body>
     <div class="chart-container">
         <div class="header">
-            {chart_data.get('title', 'Baseball Chart')}
+            $title
         </div>
         <div class="content">
             <div class="chart-and-data">
                 <div class="chart-image">
-                    {"<img src='data:image/png;base64," + chart_data['image_data'] + "' alt='Chart'/>" if chart_data.get('image_data') else "<div style='padding: 20px; text-align: center; color: #6c757d;'>No chart available</div>"}
+                    $image_tag
                 </div>
                 <div class="summary-data">
-                    {_format_summary_metrics(summary_data)}
+                    $metrics
                 </div>
             </div>
         </div>
     </div>
 </body>
-</html>
-"""
-    return html_content.strip()
+</html>""")
 
 
-def _create_full_artifact_content(chart_data: Dict[str, Any]) -> str:
-    """Create full HTML content for detailed display."""
-    
-    html_content = f"""
-<!DOCTYPE html>
+# Detailed artifact page
+_FULL_HTML_TMPL = Template("""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{chart_data.get('title', 'Chart')}</title>
+    <title>$page_title</title>
     <style>
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             margin: 0;
             padding: 20px;
             background-color: #f8f9fa;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1000px;
             margin: 0 auto;
             background: white;
             border-radius: 12px;
             box-shadow: 0 4px 20px rgba(0,0,0,0.1);
             overflow: hidden;
-        }}
-        .header {{
+        }
+        .header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 24px;
             text-align: center;
-        }}
-        .header h1 {{
+        }
+        .header h1 {
             margin: 0;
             font-size: 24px;
             font-weight: bold;
-        }}
-        .content {{
+        }
+        .content {
             display: grid;
             grid-template-columns: 2fr 1fr;
             gap: 24px;
             padding: 24px;
-        }}
-        .chart-section {{
+        }
+        .chart-section {
             background: #f8f9fa;
             padding: 20px;
             border-radius: 8px;
             border: 1px solid #e9ecef;
-        }}
-        .chart-section h2 {{
+        }
+        .chart-section h2 {
             margin: 0 0 16px 0;
             color: #495057;
             font-size: 18px;
-        }}
-        .chart-image {{
+        }
+        .chart-image {
             width: 100%;
             height: auto;
             border-radius: 8px;
             border: 1px solid #dee2e6;
-        }}
-        .data-section {{
+        }
+        .data-section {
             background: #ffffff;
             padding: 20px;
             border-radius: 8px;
             border: 1px solid #e9ecef;
-        }}
-        .data-section h2 {{
+        }
+        .data-section h2 {
             margin: 0 0 16px 0;
             color: #495057;
             font-size: 18px;
-        }}
-        .insights {{
+        }
+        .insights {
             list-style: none;
             padding: 0;
             margin: 0;
-        }}
-        .insights li {{
+        }
+        .insights li {
             padding: 8px 12px;
             margin-bottom: 8px;
             background: #f8f9fa;
@@ -226,41 +218,77 @@ def _create_full_artifact_content(chart_data: Dict[str, Any]) -> str:
             border-left: 4px solid #667eea;
             font-size: 14px;
             line-height: 1.4;
-        }}
-        .insights li.category {{
+        }
+        .insights li.category {
             background: #e3f2fd;
             border-left-color: #1976d2;
             font-weight: bold;
-        }}
-        @media (max-width: 768px) {{
-            .content {{
+        }
+        @media (max-width: 768px) {
+            .content {
                 grid-template-columns: 1fr;
-            }}
-        }}
+            }
+        }
     </style>
 </head>
 <body>
     <div class="container">
         <div class="header">
-            <h1>{chart_data.get('title', 'Baseball Chart')}</h1>
+            <h1>$title</h1>
         </div>
         <div class="content">
             <div class="chart-section">
                 <h2>📊 Visualization</h2>
-                {"<img src='data:image/png;base64," + chart_data['image_data'] + "' class='chart-image' alt='Chart'/>" if chart_data.get('image_data') else "<p>No chart data available</p>"}
+                $image_tag
             </div>
             <div class="data-section">
                 <h2>📈 Analysis</h2>
                 <ul class="insights">
-                    {_format_insights_list(chart_data.get('insights', []))}
+                    $insights
                 </ul>
             </div>
         </div>
     </div>
 </body>
-</html>
-"""
-    return html_content.strip()
+</html>""")
+
+
+def _create_compact_artifact_content(chart_data: Dict[str, Any]) -> str:
+    """Create compact HTML content for inline display."""
+    
+    # Extract summary metrics
+    summary_data = _extract_summary_metrics(chart_data)
+    image_uri = image_data_uri(chart_data)
+    
+    image_tag = (
+        f"<img src='{image_uri}' alt='Chart'/>" if image_uri
+        else "<div style='padding: 20px; text-align: center; color: #6c757d;'>No chart available</div>"
+    )
+    
+    return _COMPACT_HTML_TMPL.substitute(
+        page_title=chart_data.get('title', 'Chart'),
+        title=chart_data.get('title', 'Baseball Chart'),
+        image_tag=image_tag,
+        metrics=_format_summary_metrics(summary_data)
+    )
+
+
+def _create_full_artifact_content(chart_data: Dict[str, Any]) -> str:
+    """Create full HTML content for detailed display."""
+    
+    image_uri = image_data_uri(chart_data)
+    
+    image_tag = (
+        f"<img src='{image_uri}' class='chart-image' alt='Chart'/>"
+        if image_uri else "<p>No chart data available</p>"
+    )
+    
+    return _FULL_HTML_TMPL.substitute(
+        page_title=chart_data.get('title', 'Chart'),
+        title=chart_data.get('title', 'Baseball Chart'),
+        image_tag=image_tag,
+        insights=_format_insights_list(chart_data.get('insights', []))
+    )
 
 
 def _extract_summary_metrics(chart_data: Dict[str, Any]) -> Dict[str, str]:
@@ -328,7 +356,7 @@ def _format_insights_list(insights: list) -> str:
     
     for insight in insights:
         insight = insight.strip()
-        if insight.startswith(('📊', '🎯', '⚡')):
+        if insight.startswith(CATEGORY_PREFIXES):
             # Category header
             clean_insight = insight.replace('**', '').replace('*', '')
             formatted_insights.append(f'<li class="category">{clean_insight}</li>')
@@ -367,7 +395,7 @@ def create_chart_response_with_artifact(chart_data: Dict[str, Any], compact: boo
     # Add key metrics to summary
     insights = chart_data.get('insights', [])
     for insight in insights[:3]:  # Show top 3 insights
-        if insight.strip() and not insight.startswith(('📊', '🎯', '⚡')):
+        if insight.strip() and not insight.startswith(CATEGORY_PREFIXES):
             clean_insight = insight.replace('- ', '').replace('**', '').replace('*', '')
             summary_lines.append(f"• {clean_insight}")
     
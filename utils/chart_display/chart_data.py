@@ -0,0 +1,22 @@
+"""
+Shared helpers for chart data passed between the chart processor and artifact creator.
+"""
+
+from typing import Dict, Any
+
+# Leading emoji that mark a category header in chart insights
+CATEGORY_PREFIXES = ('📊', '🎯', '⚡')
+
+
+def image_data_uri(chart_data: Dict[str, Any]) -> str:
+    """Return the chart image as a data URI, cached on chart_data after the first call."""
+    uri = chart_data.get('image_data_uri')
+    if uri is None:
+        image_data = chart_data.get('image_data') or ''
+        # Plotting tools already pass a full data URI; extracted charts carry raw base64
+        if image_data and not image_data.startswith('data:'):
+            uri = f"data:image/png;base64,{image_data}"
+        else:
+            uri = image_data
+        chart_data['image_data_uri'] = uri
+    return uri
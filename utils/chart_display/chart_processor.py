@@ -4,23 +4,187 @@ Chart processor for converting baseball chart outputs to displayable artifacts.
 
 import re
 import json
+from string import Template
 from typing import Dict, Any, Optional, Tuple
 import pandas as pd
 
+from .chart_data import CATEGORY_PREFIXES, image_data_uri
+
+# Chart detection and extraction patterns, compiled once at import
+_SPRAY_RE = re.compile(r'# (.+) - (\d+) Spray Chart')
+_COMPARE_RE = re.compile(r'# (\d+) (Batting|Pitching) Comparison')
+_TITLE_RE = re.compile(r'# (.+)')
+_IMG_RE = re.compile(r'!\[.*?\]\(data:image/png;base64,([^)]+)\)')
+
+# Per-type chart header patterns in priority order, shared by every ChartProcessor
+_CHART_PATTERNS = {
+    'spray_chart': _SPRAY_RE,
+    'comparison_chart': _COMPARE_RE
+}
+
+# Classifies each stripped line as an insight header, a bullet or a table row;
+# every branch is greedy and ends on a non-space so padded lines never backtrack
+_LINE_RE = re.compile(
+    r'^[^\S\n]*'
+    r'(?:(?P<hdr>[📊🎯⚡](?:[^\n]*\S)?)'
+    r'|(?P<bullet>-(?:[^\n]*\S)?)'
+    r'|(?P<tbl>(?![#\s])[^\n]*\|(?:[^\n]*\S)?))'
+    r'[^\S\n]*$',
+    re.MULTILINE
+)
+
+
+# Full chart page; static markup and CSS are built once, only fields are substituted
+_HTML_TMPL = Template("""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>$title</title>
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            margin: 20px;
+            background-color: #f8f9fa;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background: white;
+            border-radius: 8px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+            overflow: hidden;
+        }
+        .header {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 20px;
+            text-align: center;
+        }
+        .content {
+            display: flex;
+            flex-wrap: wrap;
+            gap: 20px;
+            padding: 20px;
+        }
+        .chart-section {
+            flex: 2;
+            min-width: 300px;
+        }
+        .data-section {
+            flex: 1;
+            min-width: 250px;
+        }
+        .chart-image {
+            width: 100%;
+            height: auto;
+            border-radius: 8px;
+            border: 1px solid #ddd;
+        }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            margin-top: 10px;
+        }
+        th, td {
+            border: 1px solid #ddd;
+            padding: 8px;
+            text-align: left;
+        }
+        th {
+            background-color: #f2f2f2;
+            font-weight: bold;
+        }
+        tr:nth-child(even) {
+            background-color: #f9f9f9;
+        }
+        .section-title {
+            font-size: 18px;
+            font-weight: bold;
+            margin-bottom: 10px;
+            color: #333;
+        }
+        @media (max-width: 768px) {
+            .content {
+                flex-direction: column;
+            }
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>$title</h1>
+        </div>
+        <div class="content">
+            <div class="chart-section">
+                <div class="section-title">📊 Visualization</div>
+                $image_tag
+            </div>
+            <div class="data-section">
+                <div class="section-title">📈 Summary Data</div>
+                $table_tag
+            </div>
+        </div>
+    </div>
+</body>
+</html>""")
+
+
+# Compact display skeletons, precomposed for charts with and without an image
+_SPRAY_TMPL_WITH_IMG = Template("""
+<div style="background: white; border: 1px solid #ddd; border-radius: 8px; padding: 15px; max-width: 400px;">
+    <h3 style="margin: 0 0 10px 0; color: #333;">$title</h3>
+    <div style="display: flex; gap: 10px;">
+        <div style="flex: 1;">
+            <img src='$image_uri' style='width: 100%; height: auto; border-radius: 4px;'/>
+        </div>
+        <div style="flex: 1; font-size: 12px;">
+            $metrics
+        </div>
+    </div>
+</div>
+""")
+_SPRAY_TMPL_NO_IMG = Template("""
+<div style="background: white; border: 1px solid #ddd; border-radius: 8px; padding: 15px; max-width: 400px;">
+    <h3 style="margin: 0 0 10px 0; color: #333;">$title</h3>
+    <div style="display: flex; gap: 10px;">
+        <div style="flex: 1;">
+            
+        </div>
+        <div style="flex: 1; font-size: 12px;">
+            $metrics
+        </div>
+    </div>
+</div>
+""")
+_COMPARISON_TMPL_WITH_IMG = Template("""
+<div style="background: white; border: 1px solid #ddd; border-radius: 8px; padding: 15px; max-width: 600px;">
+    <h3 style="margin: 0 0 10px 0; color: #333;">$title</h3>
+    <img src='$image_uri' style='width: 100%; height: auto; border-radius: 4px;'/>
+</div>
+""")
+_COMPARISON_TMPL_NO_IMG = Template("""
+<div style="background: white; border: 1px solid #ddd; border-radius: 8px; padding: 15px; max-width: 600px;">
+    <h3 style="margin: 0 0 10px 0; color: #333;">$title</h3>
+    
+</div>
+""")
+
 
 class ChartProcessor:
     """Processes baseball chart outputs and converts them to artifact-ready format."""
     
     def __init__(self):
-        self.chart_patterns = {
-            'spray_chart': r'# (.+) - (\d+) Spray Chart',
-            'comparison_chart': r'# (\d+) (Batting|Pitching) Comparison'
-        }
+        self.chart_patterns = _CHART_PATTERNS
     
     def detect_chart_type(self, output: str) -> Optional[str]:
         """Detect if output contains a chart and what type."""
+        # Every chart header starts with '# '
+        if '# ' not in output:
+            return None
         for chart_type, pattern in self.chart_patterns.items():
-            if re.search(pattern, output):
+            if pattern.search(output):
                 return chart_type
         return None
     
@@ -36,27 +200,28 @@ class ChartProcessor:
         }
         
         # Extract title
-        title_match = re.search(r'# (.+)', output)
+        title_match = _TITLE_RE.search(output)
         if title_match:
             data['title'] = title_match.group(1)
         
         # Extract base64 image if present
-        img_match = re.search(r'!\[.*?\]\(data:image/png;base64,([^)]+)\)', output)
+        img_match = _IMG_RE.search(output)
         if img_match:
             data['image_data'] = img_match.group(1)
+            data['image_data_uri'] = f"data:image/png;base64,{data['image_data']}"
         
-        # Extract insights/text content
-        lines = output.split('\n')
+        # Extract insights/text content in a single pass over the output
         current_section = None
         
-        for line in lines:
-            line = line.strip()
-            if line.startswith('📊') or line.startswith('🎯') or line.startswith('⚡'):
+        for match in _LINE_RE.finditer(output):
+            kind = match.lastgroup
+            line = match.group(kind)
+            if kind == 'hdr':
                 current_section = line
                 data['insights'].append(line)
-            elif line.startswith('-') and current_section:
+            elif kind == 'bullet' and current_section:
                 data['insights'].append(line)
-            elif '|' in line and not line.startswith('#'):
+            elif kind == 'tbl' or '|' in line:
                 # Potential table data
                 data['tabular_data'].append(line)
         
@@ -64,7 +229,8 @@ class ChartProcessor:
     
     def create_tabular_summary(self, chart_data: Dict[str, Any]) -> str:
         """Create tabular summary from chart insights."""
-        if not chart_data['insights']:
+        # Without a category header the rows would have no table to sit in
+        if not any(insight.startswith(CATEGORY_PREFIXES) for insight in chart_data['insights']):
             return ""
         
         # Convert insights to a simple table format
@@ -72,8 +238,8 @@ class ChartProcessor:
         current_category = ""
         
         for insight in chart_data['insights']:
-            if insight.startswith(('📊', '🎯', '⚡')):
-                current_category = insight.replace('**', '').replace('*', '')
+            if insight.startswith(CATEGORY_PREFIXES):
+                current_category = insight.replace('*', '')
                 table_rows.append(f"| **{current_category}** | |")
                 table_rows.append("| --- | --- |")
             elif insight.startswith('-'):
@@ -107,103 +273,22 @@ class ChartProcessor:
     def _create_html_content(self, chart_data: Dict[str, Any], table_summary: str) -> str:
         """Create HTML content combining chart and table."""
         
-        html_content = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{chart_data['title']}</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            margin: 20px;
-            background-color: #f8f9fa;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 8px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            overflow: hidden;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 20px;
-            text-align: center;
-        }}
-        .content {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 20px;
-            padding: 20px;
-        }}
-        .chart-section {{
-            flex: 2;
-            min-width: 300px;
-        }}
-        .data-section {{
-            flex: 1;
-            min-width: 250px;
-        }}
-        .chart-image {{
-            width: 100%;
-            height: auto;
-            border-radius: 8px;
-            border: 1px solid #ddd;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin-top: 10px;
-        }}
-        th, td {{
-            border: 1px solid #ddd;
-            padding: 8px;
-            text-align: left;
-        }}
-        th {{
-            background-color: #f2f2f2;
-            font-weight: bold;
-        }}
-        tr:nth-child(even) {{
-            background-color: #f9f9f9;
-        }}
-        .section-title {{
-            font-size: 18px;
-            font-weight: bold;
-            margin-bottom: 10px;
-            color: #333;
-        }}
-        @media (max-width: 768px) {{
-            .content {{
-                flex-direction: column;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>{chart_data['title']}</h1>
-        </div>
-        <div class="content">
-            <div class="chart-section">
-                <div class="section-title">📊 Visualization</div>
-                {"<img src='data:image/png;base64," + chart_data['image_data'] + "' class='chart-image' alt='Chart'/>" if chart_data['image_data'] else "<p>No chart data available</p>"}
-            </div>
-            <div class="data-section">
-                <div class="section-title">📈 Summary Data</div>
-                {"<table>" + table_summary + "</table>" if table_summary else "<p>No summary data available</p>"}
-            </div>
-        </div>
-    </div>
-</body>
-</html>
-"""
-        return html_content.strip()
+        image_uri = image_data_uri(chart_data)
+        
+        image_tag = (
+            f"<img src='{image_uri}' class='chart-image' alt='Chart'/>"
+            if image_uri else "<p>No chart data available</p>"
+        )
+        table_tag = (
+            f"<table>{table_summary}</table>"
+            if table_summary else "<p>No summary data available</p>"
+        )
+        
+        return _HTML_TMPL.substitute(
+            title=chart_data['title'],
+            image_tag=image_tag,
+            table_tag=table_tag
+        )
 
 
 def create_compact_chart_display(chart_data: Dict[str, Any]) -> str:
@@ -221,6 +306,8 @@ def create_compact_chart_display(chart_data: Dict[str, Any]) -> str:
 def _create_compact_spray_display(chart_data: Dict[str, Any]) -> str:
     """Create compact spray chart display."""
     
+    image_uri = image_data_uri(chart_data)
+    
     # Extract key metrics for compact display
     metrics = []
     for insight in chart_data['insights']:
@@ -231,29 +318,18 @@ def _create_compact_spray_display(chart_data: Dict[str, Any]) -> str:
         elif insight.startswith('- ') and ('Field:' in insight or '%' in insight):
             metrics.append(insight.replace('- ', ''))
     
-    compact_html = f"""
-<div style="background: white; border: 1px solid #ddd; border-radius: 8px; padding: 15px; max-width: 400px;">
-    <h3 style="margin: 0 0 10px 0; color: #333;">{chart_data['title']}</h3>
-    <div style="display: flex; gap: 10px;">
-        <div style="flex: 1;">
-            {"<img src='data:image/png;base64," + chart_data['image_data'] + "' style='width: 100%; height: auto; border-radius: 4px;'/>" if chart_data['image_data'] else ""}
-        </div>
-        <div style="flex: 1; font-size: 12px;">
-            {"<br>".join(metrics)}
-        </div>
-    </div>
-</div>
-"""
-    return compact_html
+    if image_uri:
+        return _SPRAY_TMPL_WITH_IMG.substitute(
+            title=chart_data['title'], image_uri=image_uri, metrics="<br>".join(metrics)
+        )
+    return _SPRAY_TMPL_NO_IMG.substitute(title=chart_data['title'], metrics="<br>".join(metrics))
 
 
 def _create_compact_comparison_display(chart_data: Dict[str, Any]) -> str:
     """Create compact comparison chart display."""
     
-    compact_html = f"""
-<div style="background: white; border: 1px solid #ddd; border-radius: 8px; padding: 15px; max-width: 600px;">
-    <h3 style="margin: 0 0 10px 0; color: #333;">{chart_data['title']}</h3>
-    {"<img src='data:image/png;base64," + chart_data['image_data'] + "' style='width: 100%; height: auto; border-radius: 4px;'/>" if chart_data['image_data'] else ""}
-</div>
-"""
-    return compact_html
+    image_uri = image_data_uri(chart_data)
+    
+    if image_uri:
+        return _COMPARISON_TMPL_WITH_IMG.substitute(title=chart_data['title'], image_uri=image_uri)
+    return _COMPARISON_TMPL_NO_IMG.substitute(title=chart_data['title'])
@@ -4,8 +4,28 @@ Chart response processor for converting pybaseball charts to Claude artifacts.
 
 import json
 import re
+from itertools import islice
 from typing import Dict, Any, Optional
 
+# Chart detection patterns, compiled once at import
+_SPRAY_RE = re.compile(r'# (.+) - (\d+) Spray Chart')
+_COMPARE_RE = re.compile(r'# (\d+) (Batting|Pitching) Comparison')
+_IMG_RE = re.compile(r'!\[.*?\]\(data:image/png;base64,([^)]+)\)')
+
+# Summary fields; scanned independently because a heading line can also
+# carry an insight header or a metric
+_TITLE_RE = re.compile(r'# (.+)')
+_METRIC_RE = re.compile(r'- (.+): (.+)')
+_INSIGHT_RE = re.compile(r'(?:📊|🎯|⚡) \*\*(.+?)\*\*')
+
+# Fallback chart markers combined so a response is scanned only once
+_CHART_RE = re.compile('|'.join(p.pattern for p in (_SPRAY_RE, _COMPARE_RE, _IMG_RE)))
+
+# Keywords that select the compact display, matched case-insensitively so the
+# response never needs a lowercased copy
+_COMPACT_KEYWORDS = ("spray chart", "comparison", "inline", "compact")
+_COMPACT_RE = re.compile('|'.join(map(re.escape, _COMPACT_KEYWORDS)), re.IGNORECASE)
+
 
 def detect_and_process_chart(response: str) -> Optional[Dict[str, Any]]:
     """
@@ -25,8 +45,8 @@ def detect_and_process_chart(response: str) -> Optional[Dict[str, Any]]:
             artifact_start = response.find("CHART_ARTIFACT:") + len("CHART_ARTIFACT:")
             artifact_data_str = response[artifact_start:].strip()
             
-            # Parse the artifact data (safely, since we control the format)
-            artifact_data = eval(artifact_data_str)
+            # Parse the artifact data (serialized as JSON by the plotting tools)
+            artifact_data = json.loads(artifact_data_str)
             
             return {
                 "has_chart": True,
@@ -38,20 +58,18 @@ def detect_and_process_chart(response: str) -> Optional[Dict[str, Any]]:
             print(f"Error processing chart artifact: {e}")
             return None
     
+    # Every fallback pattern needs a heading or an image marker, so skip the
+    # regex scan entirely when neither is present (the common case)
+    if '# ' not in response and '![' not in response:
+        return None
+    
     # Look for traditional chart patterns (fallback)
-    chart_patterns = [
-        r'# (.+) - (\d+) Spray Chart',
-        r'# (\d+) (Batting|Pitching) Comparison',
-        r'!\[.*?\]\(data:image/png;base64,([^)]+)\)'
-    ]
-    
-    for pattern in chart_patterns:
-        if re.search(pattern, response):
-            return {
-                "has_chart": True,
-                "needs_processing": True,
-                "raw_response": response
-            }
+    if _CHART_RE.search(response):
+        return {
+            "has_chart": True,
+            "needs_processing": True,
+            "raw_response": response
+        }
     
     return None
 
@@ -100,15 +118,7 @@ def should_use_compact_display(response: str) -> bool:
     """
     
     # Use compact display for most cases to ensure inline visibility
-    compact_keywords = [
-        "spray chart",
-        "comparison",
-        "inline",
-        "compact"
-    ]
-    
-    response_lower = response.lower()
-    return any(keyword in response_lower for keyword in compact_keywords)
+    return _COMPACT_RE.search(response) is not None
 
 
 def extract_chart_summary(response: str) -> Dict[str, Any]:
@@ -129,17 +139,15 @@ def extract_chart_summary(response: str) -> Dict[str, Any]:
     }
     
     # Extract title
-    title_match = re.search(r'# (.+)', response)
+    title_match = _TITLE_RE.search(response)
     if title_match:
         summary["title"] = title_match.group(1)
     
-    # Extract key metrics
-    metric_pattern = r'- (.+): (.+)'
-    metrics = re.findall(metric_pattern, response)
-    summary["key_metrics"] = [f"{metric}: {value}" for metric, value in metrics[:5]]
+    # Extract key metrics, stopping after the first five
+    metrics = islice(_METRIC_RE.finditer(response), 5)
+    summary["key_metrics"] = [f"{m.group(1)}: {m.group(2)}" for m in metrics]
     
     # Extract insights sections
-    insight_sections = re.findall(r'(📊|🎯|⚡) \*\*(.+?)\*\*', response)
-    summary["insights"] = [section[1] for section in insight_sections]
+    summary["insights"] = _INSIGHT_RE.findall(response)
     
     return summary
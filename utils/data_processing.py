@@ -8,12 +8,33 @@ from various sources including FanGraphs, Baseball Reference, and Statcast.
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Optional, Union
-import base64
+from datetime import date
 import io
 import logging
+import re
+
+try:
+    # SIMD-accelerated drop-in replacement for the stdlib encoder
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
 
 logger = logging.getLogger(__name__)
 
+# Column name cleanup patterns
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _format_float_cell(value: float) -> str:
+    """Format a float table cell in general format, as tabulate's default floatfmt does"""
+    return format(value, 'g')
+
+
+def _format_cell(value: Any) -> str:
+    """Format a non-float table cell, leaving missing values blank like tabulate"""
+    return '' if value is None else str(value)
+
 
 class DataProcessor:
     """Handles data processing and formatting for baseball statistics"""
@@ -51,21 +72,43 @@ class DataProcessor:
             'CWS': 'Chicago White Sox',
             'NYY': 'New York Yankees'
         }
+        
+        # Lowercased full names, computed once for team name resolution
+        self._full_to_abbr = {
+            full_name.lower(): abbr for abbr, full_name in self.team_abbreviations.items()
+        }
 
     def format_dataframe_as_markdown(self, df: pd.DataFrame, title: str = "") -> str:
         """Convert a pandas DataFrame to formatted markdown table"""
         if df.empty:
             return f"## {title}\n\nNo data available."
         
-        # Round numeric columns to reasonable precision
-        df_formatted = df.copy()
-        for col in df_formatted.select_dtypes(include=[np.number]).columns:
-            if df_formatted[col].dtype == 'float64':
-                df_formatted[col] = df_formatted[col].round(3)
+        # Round float columns to reasonable precision in one vectorized pass
+        float_cols = df.select_dtypes(include='float64').columns
+        if len(float_cols):
+            df_formatted = df.copy()
+            df_formatted[float_cols] = df_formatted[float_cols].round(3)
+        else:
+            df_formatted = df
+        
+        # Write the pipe table directly rather than through tabulate's
+        # per-cell width and alignment machinery
+        numeric = set(df_formatted.select_dtypes(include=[np.number]).columns)
+        header = "| " + " | ".join(str(col) for col in df_formatted.columns) + " |"
+        separator = "|" + "|".join(
+            "---:" if col in numeric else ":---" for col in df_formatted.columns
+        ) + "|"
+        # Float cells use general format like tabulate did, so whole numbers
+        # print as 200 and large values switch to exponent form
+        columns = [
+            map(_format_float_cell if dtype.kind == 'f' else _format_cell,
+                df_formatted.iloc[:, i].to_numpy(dtype=object))
+            for i, dtype in enumerate(df_formatted.dtypes)
+        ]
+        rows = ["| " + " | ".join(cells) + " |" for cells in zip(*columns)]
         
         markdown = f"## {title}\n\n" if title else ""
-        markdown += df_formatted.to_markdown(index=False, tablefmt="pipe")
-        return markdown
+        return markdown + "\n".join([header, separator, *rows])
 
     def add_statistical_context(self, df: pd.DataFrame, metric_col: str) -> str:
         """Add statistical context to data (percentiles, league averages, etc.)"""
@@ -76,15 +119,18 @@ class DataProcessor:
         if len(values) == 0:
             return ""
         
+        # One quantile call covers min, quartiles, median and max
+        arr = values.to_numpy(dtype=float)
+        q_min, q25, median, q75, q_max = np.quantile(arr, [0.0, 0.25, 0.5, 0.75, 1.0])
+        
         stats = {
-            'count': len(values),
-            'mean': values.mean(),
-            'median': values.median(),
-            'std': values.std(),
-            'min': values.min(),
-            'max': values.max(),
-            'q25': values.quantile(0.25),
-            'q75': values.quantile(0.75)
+            'count': arr.size,
+            'mean': arr.mean(),
+            'median': median,
+            'min': q_min,
+            'max': q_max,
+            'q25': q25,
+            'q75': q75
         }
         
         context = f"""
@@ -130,8 +176,13 @@ class DataProcessor:
             return team_upper
         
         # Check if it's a full name that maps to an abbreviation
-        for abbr, full_name in self.team_abbreviations.items():
-            if team_input.lower() in full_name.lower():
+        team_lower = team_input.lower()
+        if team_lower in self._full_to_abbr:
+            return self._full_to_abbr[team_lower]
+        
+        # Fall back to a partial name match (e.g., "Yankees")
+        for full_lower, abbr in self._full_to_abbr.items():
+            if team_lower in full_lower:
                 return abbr
         
         # Return original if no match found
@@ -150,25 +201,29 @@ class DataProcessor:
         if context:
             insights.append(f"🔍 **Context**: {context}")
         
+        # Get player/team name if available
+        name_col = None
+        for possible_name in ['Name', 'Player', 'Team', 'name', 'player', 'team']:
+            if possible_name in df.columns:
+                name_col = possible_name
+                break
+        name_values = df[name_col].to_numpy() if name_col else None
+        
         # Identify notable values in numeric columns
         numeric_cols = df.select_dtypes(include=[np.number]).columns
         for col in numeric_cols[:3]:  # Limit to first 3 numeric columns
-            if not df[col].isna().all():
-                max_val = df[col].max()
-                min_val = df[col].min()
-                max_idx = df[col].idxmax()
-                min_idx = df[col].idxmin()
-                
-                # Get player/team name if available
-                name_col = None
-                for possible_name in ['Name', 'Player', 'Team', 'name', 'player', 'team']:
-                    if possible_name in df.columns:
-                        name_col = possible_name
-                        break
+            series = df[col]
+            arr = series.to_numpy(dtype=float, na_value=np.nan)
+            if not np.isnan(arr).all():
+                # Positions of the extremes, found in one pass each over the array
+                max_pos = int(np.nanargmax(arr))
+                min_pos = int(np.nanargmin(arr))
+                max_val = series.iloc[max_pos]
+                min_val = series.iloc[min_pos]
                 
                 if name_col:
-                    max_name = df.loc[max_idx, name_col]
-                    min_name = df.loc[min_idx, name_col]
+                    max_name = name_values[max_pos]
+                    min_name = name_values[min_pos]
                     insights.append(f"🏆 **{col}**: Highest = {max_val} ({max_name}), Lowest = {min_val} ({min_name})")
                 else:
                     insights.append(f"📈 **{col}**: Range = {min_val} to {max_val}")
@@ -177,26 +232,38 @@ class DataProcessor:
 
     def encode_image_to_base64(self, image_buffer: io.BytesIO) -> str:
         """Encode image buffer to base64 string"""
-        image_buffer.seek(0)
-        img_str = base64.b64encode(image_buffer.read()).decode()
+        if isinstance(image_buffer, io.BytesIO):
+            # Encode straight from the buffer's memory instead of copying it out
+            with image_buffer.getbuffer() as raw:
+                img_str = b64encode(raw).decode('ascii')
+        else:
+            image_buffer.seek(0)
+            img_str = b64encode(image_buffer.read()).decode('ascii')
         return f"data:image/png;base64,{img_str}"
 
     def clean_column_names(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean and standardize column names"""
-        df_clean = df.copy()
+        # Only the column labels change, so a shallow copy is enough
+        df_clean = df.copy(deep=False)
         
         # Remove special characters and standardize
-        df_clean.columns = df_clean.columns.str.replace(r'[^\w\s]', '', regex=True)
-        df_clean.columns = df_clean.columns.str.replace(r'\s+', '_', regex=True)
-        df_clean.columns = df_clean.columns.str.strip()
+        df_clean.columns = [
+            _WHITESPACE_RE.sub('_', _SPECIAL_CHARS_RE.sub('', col)) for col in df.columns
+        ]
         
         return df_clean
 
     def validate_date_range(self, start_date: str, end_date: str) -> bool:
         """Validate that date range is reasonable"""
         try:
-            start = pd.to_datetime(start_date)
-            end = pd.to_datetime(end_date)
+            # Plain ISO dates are the common case; only fall back to pandas'
+            # more permissive (and much slower) parser when that fails
+            try:
+                start = date.fromisoformat(start_date)
+                end = date.fromisoformat(end_date)
+            except (TypeError, ValueError):
+                start = pd.to_datetime(start_date)
+                end = pd.to_datetime(end_date)
             
             # Check that start is before end
             if start >= end:
@@ -207,5 +274,5 @@ class DataProcessor:
                 return False
             
             return True
-        except:
+        except Exception:
             return False
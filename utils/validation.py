@@ -5,42 +5,134 @@ This module provides input validation, error handling, and data validation
 functions to ensure robust operation of the MCP server.
 """
 
-import re
-from typing import List, Optional, Union, Tuple
+import string
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Union, Tuple
 from datetime import datetime, date
 import logging
+import time
+from functools import lru_cache
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Deletion table for the letters and punctuation allowed in player names;
+# anything left over apart from whitespace is an invalid character
+_NAME_STRIP_TABLE = str.maketrans('', '', string.ascii_letters + "-'.")
+
+# Same rule as a pattern, for vectorized checks over a batch of names
+_NAME_PATTERN = r"[a-zA-Z\s\-'\.]+"
+
+# Deletion table for characters stripped by sanitize_input
+_SANITIZE_TABLE = str.maketrans('', '', '<>"\';')
+
+# Accepted values, shared by every Validator instance
+_VALID_TEAMS = frozenset({
+    'LAA', 'HOU', 'OAK', 'TOR', 'ATL', 'MIL', 'STL', 'CHC', 
+    'ARI', 'LAD', 'SF', 'CLE', 'SEA', 'MIA', 'NYM', 'WSH',
+    'BAL', 'SD', 'PHI', 'PIT', 'TEX', 'TB', 'BOS', 'CIN',
+    'COL', 'KC', 'DET', 'MIN', 'CWS', 'NYY'
+})
+
+_VALID_POSITIONS = frozenset({
+    'C', '1B', '2B', '3B', 'SS', 'LF', 'CF', 'RF', 'DH', 'P'
+})
+
+_VALID_STAT_SOURCES = frozenset({
+    'fangraphs', 'baseball_reference', 'bref', 'fg'
+})
+
+# Sorted listings for error messages; the sets are fixed so these are too
+_VALID_TEAMS_STR = ", ".join(sorted(_VALID_TEAMS))
+_VALID_POSITIONS_STR = ", ".join(sorted(_VALID_POSITIONS))
+_VALID_STAT_SOURCES_STR = ", ".join(sorted(_VALID_STAT_SOURCES))
+
+# String spellings accepted by validate_boolean
+_BOOLEAN_STRINGS = {
+    'true': True, '1': True, 'yes': True, 'on': True,
+    'false': False, '0': False, 'no': False, 'off': False
+}
+
+# Accepted date formats keyed by (separator, year comes first)
+_DATE_FORMATS_BY_SHAPE = {
+    ('-', True): '%Y-%m-%d',     # 2023-01-01
+    ('/', False): '%m/%d/%Y',    # 01/01/2023
+    ('-', False): '%m-%d-%Y',    # 01-01-2023
+    ('/', True): '%Y/%m/%d',     # 2023/01/01
+}
+
+# Longest accepted date range (about five years)
+_MAX_RANGE_DAYS = 365 * 5
+
+# Lowercase name suffixes and their preferred spelling
+_NAME_ABBREVIATIONS = (
+    ('jr', 'Jr.'),
+    ('sr', 'Sr.'),
+    ('ii', 'II'),
+    ('iii', 'III')
+)
+
+# Current year and the monotonic time it was read; refreshed hourly so a
+# long-running server still rolls over at New Year
+_CURRENT_YEAR_TTL = 3600.0
+_current_year_cache = [0, float('-inf')]
+
+
+def _current_year() -> int:
+    """Return the current calendar year, re-reading the clock at most hourly"""
+    now = time.monotonic()
+    if now - _current_year_cache[1] > _CURRENT_YEAR_TTL:
+        _current_year_cache[:] = [datetime.now().year, now]
+    return _current_year_cache[0]
+
 
 class ValidationError(Exception):
     """Custom exception for validation errors"""
     pass
 
 
+def _require_str(value, param: str) -> None:
+    """Raise ValidationError unless value is a non-empty string"""
+    if not isinstance(value, str) or not value:
+        raise ValidationError(f"{param} must be a non-empty string")
+
+
+@lru_cache(maxsize=1024)
+def _parse_date_str(date_str: str) -> date:
+    """Parse a non-empty date string in any accepted format, memoized"""
+    # Fast path for the canonical YYYY-MM-DD shape
+    if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+        try:
+            return date.fromisoformat(date_str)
+        except ValueError:
+            pass
+    
+    # Pick the one format the string's shape allows: the separator, and
+    # whether the first field is a four-digit year
+    sep = '-' if '-' in date_str else '/'
+    fmt = _DATE_FORMATS_BY_SHAPE[sep, date_str.find(sep) == 4]
+    try:
+        return datetime.strptime(date_str, fmt).date()
+    except ValueError:
+        pass
+    
+    raise ValidationError(f"Invalid date format: {date_str}. Use YYYY-MM-DD format")
+
+
 class Validator:
     """Handles input validation and data validation for baseball data requests"""
     
+    __slots__ = ('valid_teams', 'valid_positions', 'valid_stat_sources')
+    
     def __init__(self):
-        self.valid_teams = {
-            'LAA', 'HOU', 'OAK', 'TOR', 'ATL', 'MIL', 'STL', 'CHC', 
-            'ARI', 'LAD', 'SF', 'CLE', 'SEA', 'MIA', 'NYM', 'WSH',
-            'BAL', 'SD', 'PHI', 'PIT', 'TEX', 'TB', 'BOS', 'CIN',
-            'COL', 'KC', 'DET', 'MIN', 'CWS', 'NYY'
-        }
-        
-        self.valid_positions = {
-            'C', '1B', '2B', '3B', 'SS', 'LF', 'CF', 'RF', 'DH', 'P'
-        }
-        
-        self.valid_stat_sources = {
-            'fangraphs', 'baseball_reference', 'bref', 'fg'
-        }
+        self.valid_teams = _VALID_TEAMS
+        self.valid_positions = _VALID_POSITIONS
+        self.valid_stat_sources = _VALID_STAT_SOURCES
 
     def validate_player_name(self, name: str) -> str:
         """Validate and clean player name input"""
-        if not name or not isinstance(name, str):
-            raise ValidationError("Player name must be a non-empty string")
+        _require_str(name, "Player name")
         
         # Clean the name
         cleaned_name = name.strip()
@@ -52,7 +144,8 @@ class Validator:
             raise ValidationError("Player name is unusually long")
         
         # Check for reasonable characters (letters, spaces, hyphens, apostrophes)
-        if not re.match(r"^[a-zA-Z\s\-'\.]+$", cleaned_name):
+        leftover = cleaned_name.translate(_NAME_STRIP_TABLE)
+        if leftover and not leftover.isspace():
             raise ValidationError("Player name contains invalid characters")
         
         return cleaned_name
@@ -64,7 +157,7 @@ class Validator:
         except (ValueError, TypeError):
             raise ValidationError("Season must be a valid year")
         
-        current_year = datetime.now().year
+        current_year = _current_year()
         
         if season_int < 1871:  # First professional baseball season
             raise ValidationError("Season cannot be before 1871")
@@ -74,94 +167,86 @@ class Validator:
         
         return season_int
 
-    def validate_date(self, date_str: str) -> str:
-        """Validate date string format"""
-        if not date_str or not isinstance(date_str, str):
-            raise ValidationError("Date must be a non-empty string")
-        
-        # Try common date formats
-        date_formats = [
-            '%Y-%m-%d',      # 2023-01-01
-            '%m/%d/%Y',      # 01/01/2023
-            '%m-%d-%Y',      # 01-01-2023
-            '%Y/%m/%d',      # 2023/01/01
-        ]
-        
-        parsed_date = None
-        for fmt in date_formats:
-            try:
-                parsed_date = datetime.strptime(date_str, fmt)
-                break
-            except ValueError:
-                continue
-        
-        if parsed_date is None:
-            raise ValidationError(f"Invalid date format: {date_str}. Use YYYY-MM-DD format")
-        
-        # Return in standard format
-        return parsed_date.strftime('%Y-%m-%d')
+    def _parse_date(self, date_str: str) -> date:
+        """Parse a date string in any accepted format"""
+        _require_str(date_str, "Date")
+        return _parse_date_str(date_str)
 
-    def validate_date_range(self, start_date: str, end_date: str) -> Tuple[str, str]:
-        """Validate date range"""
-        start = self.validate_date(start_date)
-        end = self.validate_date(end_date)
-        
-        start_dt = datetime.strptime(start, '%Y-%m-%d')
-        end_dt = datetime.strptime(end, '%Y-%m-%d')
+    def _parse_date_range(self, start_date: str, end_date: str) -> Tuple[date, date]:
+        """Parse and check a date range, returning the parsed endpoints"""
+        start_dt = self._parse_date(start_date)
+        end_dt = self._parse_date(end_date)
         
         if start_dt >= end_dt:
             raise ValidationError("Start date must be before end date")
         
         # Check for reasonable range (not more than 5 years)
-        if (end_dt - start_dt).days > 365 * 5:
+        if (end_dt - start_dt).days > _MAX_RANGE_DAYS:
             raise ValidationError("Date range cannot exceed 5 years")
         
-        return start, end
+        return start_dt, end_dt
+
+    def validate_date(self, date_str: str) -> str:
+        """Validate date string format"""
+        # Return in standard format
+        return self._parse_date(date_str).strftime('%Y-%m-%d')
+
+    def validate_date_range(self, start_date: str, end_date: str) -> Tuple[str, str]:
+        """Validate date range"""
+        start_dt, end_dt = self._parse_date_range(start_date, end_date)
+        return start_dt.strftime('%Y-%m-%d'), end_dt.strftime('%Y-%m-%d')
 
     def validate_team(self, team: str) -> str:
         """Validate team abbreviation"""
-        if not team or not isinstance(team, str):
-            raise ValidationError("Team must be a non-empty string")
+        _require_str(team, "Team")
         
-        team_upper = team.upper().strip()
+        # Canonically-cased input needs no case conversion
+        team_stripped = team.strip()
+        if team_stripped in self.valid_teams:
+            return team_stripped
+        
+        team_upper = team_stripped.upper()
         
         if team_upper not in self.valid_teams:
-            valid_teams_str = ", ".join(sorted(self.valid_teams))
             raise ValidationError(
                 f"Invalid team abbreviation: {team}. "
-                f"Valid teams: {valid_teams_str}"
+                f"Valid teams: {_VALID_TEAMS_STR}"
             )
         
         return team_upper
 
     def validate_position(self, position: str) -> str:
         """Validate position abbreviation"""
-        if not position or not isinstance(position, str):
-            raise ValidationError("Position must be a non-empty string")
+        _require_str(position, "Position")
+        
+        position_stripped = position.strip()
+        if position_stripped in self.valid_positions:
+            return position_stripped
         
-        position_upper = position.upper().strip()
+        position_upper = position_stripped.upper()
         
         if position_upper not in self.valid_positions:
-            valid_positions_str = ", ".join(sorted(self.valid_positions))
             raise ValidationError(
                 f"Invalid position: {position}. "
-                f"Valid positions: {valid_positions_str}"
+                f"Valid positions: {_VALID_POSITIONS_STR}"
             )
         
         return position_upper
 
     def validate_stat_source(self, source: str) -> str:
         """Validate statistics source"""
-        if not source or not isinstance(source, str):
-            raise ValidationError("Source must be a non-empty string")
+        _require_str(source, "Source")
         
-        source_lower = source.lower().strip()
+        source_stripped = source.strip()
+        if source_stripped in self.valid_stat_sources:
+            return source_stripped
+        
+        source_lower = source_stripped.lower()
         
         if source_lower not in self.valid_stat_sources:
-            valid_sources_str = ", ".join(sorted(self.valid_stat_sources))
             raise ValidationError(
                 f"Invalid statistics source: {source}. "
-                f"Valid sources: {valid_sources_str}"
+                f"Valid sources: {_VALID_STAT_SOURCES_STR}"
             )
         
         return source_lower
@@ -183,14 +268,13 @@ class Validator:
 
     def validate_statcast_params(self, start_dt: str, end_dt: str) -> Tuple[str, str]:
         """Validate parameters specific to Statcast data requests"""
-        start, end = self.validate_date_range(start_dt, end_dt)
+        start, end = self._parse_date_range(start_dt, end_dt)
         
         # Statcast data is only available from 2015 onwards
-        start_dt_obj = datetime.strptime(start, '%Y-%m-%d')
-        if start_dt_obj.year < 2015:
+        if start.year < 2015:
             raise ValidationError("Statcast data is only available from 2015 onwards")
         
-        return start, end
+        return start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d')
 
     def validate_numeric_range(self, value: Union[int, float, str], 
                              min_val: Optional[float] = None,
@@ -216,11 +300,9 @@ class Validator:
             return value
         
         if isinstance(value, str):
-            value_lower = value.lower().strip()
-            if value_lower in ('true', '1', 'yes', 'on'):
-                return True
-            elif value_lower in ('false', '0', 'no', 'off'):
-                return False
+            result = _BOOLEAN_STRINGS.get(value.lower().strip())
+            if result is not None:
+                return result
         
         raise ValidationError(f"{param_name} must be a boolean value (true/false)")
 
@@ -230,10 +312,7 @@ class Validator:
             return str(text)
         
         # Remove potential problematic characters
-        sanitized = re.sub(r'[<>"\';]', '', text)
-        sanitized = sanitized.strip()
-        
-        return sanitized
+        return text.translate(_SANITIZE_TABLE).strip()
 
     def validate_and_suggest_player_name(self, name: str) -> Tuple[str, List[str]]:
         """Validate player name and provide suggestions for common issues"""
@@ -241,22 +320,124 @@ class Validator:
         suggestions = []
         
         # Common name format suggestions
-        if ',' not in cleaned_name and len(cleaned_name.split()) >= 2:
+        if ',' not in cleaned_name:
             parts = cleaned_name.split()
             if len(parts) == 2:
                 suggestions.append(f"{parts[1]}, {parts[0]}")  # "First Last" -> "Last, First"
         
         # Check for common abbreviations that should be spelled out
-        abbreviations = {
-            'jr': 'Jr.',
-            'sr': 'Sr.',
-            'ii': 'II',
-            'iii': 'III'
-        }
-        
-        for abbr, full in abbreviations.items():
-            if abbr.lower() in cleaned_name.lower() and full not in cleaned_name:
+        name_lower = cleaned_name.lower()
+        for abbr, full in _NAME_ABBREVIATIONS:
+            if abbr in name_lower and full not in cleaned_name:
                 suggested = cleaned_name.replace(abbr, full)
                 suggestions.append(suggested)
         
         return cleaned_name, suggestions
+
+    def validate_player_names(self, names: Iterable[str]) -> Tuple[List[Optional[str]], Dict[int, str]]:
+        """
+        Validate many player names at once.
+        
+        Applies the same rules as validate_player_name using pandas string
+        operations over the whole batch instead of one call per name.
+        
+        Returns:
+            Cleaned names (None where invalid) and error messages keyed by position
+        """
+        raw = _string_series(names)
+        cleaned = raw.str.strip()
+        lengths = cleaned.str.len()
+        
+        missing = cleaned.isna() | raw.eq('')
+        too_short = ~missing & (lengths < 2)
+        too_long = ~missing & (lengths > 50)
+        checked = ~(missing | too_short | too_long)
+        bad_chars = checked & ~cleaned.str.fullmatch(_NAME_PATTERN).fillna(False).astype(bool)
+        
+        return _collect_batch_results(cleaned, [
+            (missing, "Player name must be a non-empty string"),
+            (too_short, "Player name must be at least 2 characters long"),
+            (too_long, "Player name is unusually long"),
+            (bad_chars, "Player name contains invalid characters"),
+        ])
+
+    def validate_dates(self, dates: Iterable[str]) -> Tuple[List[Optional[str]], Dict[int, str]]:
+        """
+        Validate many date strings at once.
+        
+        Canonical YYYY-MM-DD values are parsed in a single pandas call; any
+        other shapes go through the regular per-date validation.
+        
+        Returns:
+            Dates in YYYY-MM-DD format (None where invalid) and error messages keyed by position
+        """
+        import pandas as pd
+        
+        raw = _string_series(dates)
+        iso = raw.str.fullmatch(r'\d{4}-\d{2}-\d{2}').fillna(False).astype(bool)
+        
+        parsed = pd.to_datetime(raw[iso], format='%Y-%m-%d', errors='coerce')
+        normalized = pd.Series(None, index=raw.index, dtype=object)
+        normalized[iso] = parsed.dt.strftime('%Y-%m-%d')
+        
+        # Everything pandas could not parse falls back to the scalar path
+        errors = {}
+        for pos in normalized.isna().to_numpy().nonzero()[0]:
+            try:
+                normalized.iat[pos] = self.validate_date(raw.iat[pos])
+            except ValidationError as e:
+                errors[int(pos)] = str(e)
+        
+        values = [None if pos in errors else value for pos, value in enumerate(normalized)]
+        return values, errors
+
+    def validate_teams(self, teams: Iterable[str]) -> Tuple[List[Optional[str]], Dict[int, str]]:
+        """
+        Validate many team abbreviations at once.
+        
+        Returns:
+            Uppercase abbreviations (None where invalid) and error messages keyed by position
+        """
+        raw = _string_series(teams)
+        normalized = raw.str.upper().str.strip()
+        
+        missing = normalized.isna() | raw.eq('')
+        unknown = ~missing & ~normalized.isin(_VALID_TEAMS)
+        
+        return _collect_batch_results(normalized, [
+            (missing, "Team must be a non-empty string"),
+            (unknown, lambda pos: (
+                f"Invalid team abbreviation: {raw.iat[pos]}. "
+                f"Valid teams: {_VALID_TEAMS_STR}"
+            )),
+        ])
+
+
+def _string_series(values: Iterable) -> 'pd.Series':
+    """Object Series of the inputs with non-string entries replaced by None"""
+    # pandas is only needed for batch validation, so it is imported on first use
+    import pandas as pd
+    
+    series = pd.Series(list(values), dtype=object)
+    return series.where(series.map(type).eq(str), None)
+
+
+def _collect_batch_results(
+    values: 'pd.Series',
+    checks: List[Tuple['pd.Series', Union[str, Callable[[int], str]]]]
+) -> Tuple[List[Optional[str]], Dict[int, str]]:
+    """
+    Turn boolean failure masks into per-position errors, first failing check wins.
+    
+    A check's message is either a fixed string or a callable that builds the
+    message from the failing position.
+    """
+    errors = {}
+    for mask, message in checks:
+        for pos in mask.to_numpy().nonzero()[0]:
+            pos = int(pos)
+            if pos not in errors:
+                errors[pos] = message(pos) if callable(message) else message
+    
+    result = [None if pos in errors else value for pos, value in enumerate(values)]
+    return result, dict(sorted(errors.items()))